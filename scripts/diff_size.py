@@ -32,6 +32,7 @@
 
 import sys
 import re
+from typing import Iterable
 
 
 class Region:
@@ -50,20 +51,27 @@ class Region:
     def __eq__(self, __o: object) -> bool:
         return self.name == __o.name
 
+    def __hash__(self) -> int:
+        return hash(self.name)
+
     def __str__(self):
         return f'{self.name}: {self.used:+0d} / {self.total:d} B ({self.percentage:+0.2f}%)'
 
 
-def get_regions(string: str) -> list:
-    regex = r"^\s+(\S+):\s+(\d+)\s(\S+)\s+(\d+)\s(\S+)\s+([\d.]+)%$"
-    # match lines like:
-    #   rom:    117572 B    128 KB  89.70%
-    # groups: [1: name, 2: used, 3: unit, 4: total, 5: unit, 6: percent]
+REGION_REGEX = re.compile(r"^\s+(\S+):\s+(\d+)\s(\S+)\s+(\d+)\s(\S+)\s+([\d.]+)%$")
+# match lines like:
+#   rom:    117572 B    128 KB  89.70%
+# groups: [1: name, 2: used, 3: unit, 4: total, 5: unit, 6: percent]
+
+UNIT_MULTIPLIER = {'B': 1, 'KB': 1024, 'MB': 1024 * 1024}
 
-    UNIT_MULTIPLIER = {'B': 1, 'KB': 1024}
 
+def get_regions(lines: Iterable[str]) -> list:
     regions = []
-    for match in re.finditer(regex, string, re.MULTILINE):
+    for line in lines:
+        match = REGION_REGEX.match(line)
+        if match is None:
+            continue
         regions.append(
             Region(
                 match.group(1),
@@ -78,11 +86,11 @@ if __name__ == '__main__':
         sys.exit(1)
 
     with open(sys.argv[1], 'r') as base_file:
-        base_regions = get_regions(base_file.read())
+        base_regions = {region.name: region for region in get_regions(base_file)}
 
     with open(sys.argv[2], 'r') as diff_file:
-        diff_regions = get_regions(diff_file.read())
+        diff_regions = {region.name: region for region in get_regions(diff_file)}
 
-    for region in base_regions:
-        if region in diff_regions:
-            print(diff_regions[diff_regions.index(region)] - region)
+    for name, region in base_regions.items():
+        if name in diff_regions:
+            print(diff_regions[name] - region)
@@ -7,41 +7,52 @@ pasting into blackmagic's nrf51.c
 
 import subprocess
 import re
-import io
+from bisect import bisect_left
 
 cmd = 'git archive --remote=git://git.code.sf.net/p/openocd/code HEAD src/flash/nor/nrf5.c | tar -xO'
 
+comment_re = re.compile(rb'/\*(.*)\*/')
+device_def_re = re.compile(rb'NRF51_DEVICE_DEF\((0x[0-9A-F]*),\s*"(.*)",\s*"(.*)",\s*"(.*)",\s*([0-9]*)\s*\),')
+
 class Spec():
     def __repr__(self):
         return "0x%04X: /* %s %s %s */"%(self.hwid,self.comment, self.variant,self.build_code)
 
 proc = subprocess.Popen(cmd,shell=True,stdout=subprocess.PIPE)
+source = proc.stdout.read()
+proc.wait()
+
+# Each device definition is described by the closest comment preceding it
+# (or sharing its line), so index the comments by where they start
+comments = list(comment_re.finditer(source))
+comment_starts = [c.start() for c in comments]
 
 specdict = {}
 specs    = []
 spec     = Spec()
-for line in io.TextIOWrapper(proc.stdout, encoding="utf-8"):
-    m = re.search(r'/\*(.*)\*/',line)
-    if m:
-        lastcomment=m.group(1)
-
-    m = re.search(r'NRF51_DEVICE_DEF\((0x[0-9A-F]*),\s*"(.*)",\s*"(.*)",\s*"(.*)",\s*([0-9]*)\s*\),', line)
-    if m:
-        spec.hwid          = int(m.group(1), base=0)
-        spec.variant       = m.group(3)
-        spec.build_code    = m.group(4)
-        spec.flash_size_kb = int(m.group(5), base=0)
-        ram, flash = {'AA':(16,256),
-                      'AB':(16,128),
-                      'AC':(32,256)}[spec.variant[-2:]]
-        assert flash == spec.flash_size_kb
-        spec.ram_size_kb = ram
-        nicecomment  = lastcomment.strip().replace('IC ','').replace('Devices ','').replace('.','')
-        spec.comment = nicecomment
-
-        specdict.setdefault((ram,flash),[]).append(spec)
-        specs.append(spec)
-        spec=Spec()
+for m in device_def_re.finditer(source):
+    line_end = source.find(b'\n', m.start())
+    if line_end == -1:
+        line_end = len(source)
+    index = bisect_left(comment_starts, line_end)
+    if index:
+        lastcomment = comments[index - 1].group(1).decode('utf-8')
+
+    spec.hwid          = int(m.group(1), base=0)
+    spec.variant       = m.group(3).decode('utf-8')
+    spec.build_code    = m.group(4).decode('utf-8')
+    spec.flash_size_kb = int(m.group(5), base=0)
+    ram, flash = {'AA':(16,256),
+                  'AB':(16,128),
+                  'AC':(32,256)}[spec.variant[-2:]]
+    assert flash == spec.flash_size_kb
+    spec.ram_size_kb = ram
+    nicecomment  = lastcomment.strip().replace('IC ','').replace('Devices ','').replace('.','')
+    spec.comment = nicecomment
+
+    specdict.setdefault((ram,flash),[]).append(spec)
+    specs.append(spec)
+    spec=Spec()
 
 for (ram,flash),specs in specdict.items():
     specs.sort(key=lambda x:x.hwid)
@@ -4,6 +4,7 @@ from argparse import ArgumentParser
 from pathlib import Path
 from subprocess import run
 from concurrent.futures import ThreadPoolExecutor
+from os import cpu_count
 from sys import exit
 
 parser = ArgumentParser(
@@ -44,10 +45,16 @@ if args.buildPath is not None:
 	print(f'Adding build path "{args.buildPath}" to extraArgs')
 	extraArgs += ['-p', args.buildPath]
 
+# Hand each worker a share of the files to check in a single clang-tidy invocation
+# so the start-up and compile_commands.json parsing cost is paid once per worker
+files = [str(file) for file in gatherFiles()]
+workers = max(min(cpu_count() or 1, len(files)), 1)
+batches = [batch for batch in (files[i::workers] for i in range(workers)) if batch]
+
 futures = []
 returncode = 0
-with ThreadPoolExecutor() as pool:
-	for file in gatherFiles():
-		futures.append(pool.submit(run, ['clang-tidy'] + extraArgs + [str(file)]))
-	returncode = max((future.result().returncode for future in futures))
+with ThreadPoolExecutor(max_workers = workers) as pool:
+	for batch in batches:
+		futures.append(pool.submit(run, ['clang-tidy'] + extraArgs + batch))
+	returncode = max((future.result().returncode for future in futures), default = 0)
 exit(returncode)